@@ -1,15 +1,30 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str = ""
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_MAX_INACTIVE_SECONDS: float = 300.0
     APIFY_TOKEN: str = ""
     LLM_PROVIDER: str = "openai"
     LLM_MODEL: str = "gpt-4o-mini"
     LLM_API_KEY: str = ""
+    LLM_MAX_CONCURRENCY: int = 10
+    LLM_BATCH_SIZE: int = 25
+    LLM_FALLBACK_MAX_COMMENTS: int = 50
+    LLM_USE_BATCH_API: bool = False
+    LLM_MAX_ATTEMPTS: int = Field(5, ge=1)
     ALLOWED_ORIGINS: str = "*"
     SCRAPING_INTERVAL_HOURS: int = 6
+    SCRAPING_CONCURRENCY: int = Field(4, ge=1)
+    APIFY_MAX_ATTEMPTS: int = Field(3, ge=1)
     LOG_LEVEL: str = "INFO"
+    ANALYTICS_CACHE_TTL_SECONDS: int = 15
+    SUGGESTIONS_CACHE_TTL_SECONDS: int = 3600
+    HEALTH_CACHE_TTL_SECONDS: float = 10.0
+    HEALTH_SCRAPE_MAX_AGE_SEC: int = 43200
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
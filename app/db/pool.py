@@ -11,8 +11,9 @@ async def init_db() -> None:
     logger.info("Initializing database connection pool")
     pool = await asyncpg.create_pool(
         settings.DATABASE_URL,
-        min_size=2,
-        max_size=10,
+        min_size=settings.DB_POOL_MIN_SIZE,
+        max_size=settings.DB_POOL_MAX_SIZE,
+        max_inactive_connection_lifetime=settings.DB_POOL_MAX_INACTIVE_SECONDS,
     )
     logger.info("Database pool created successfully")
 
@@ -0,0 +1,45 @@
+"""Keyset-paginated reads of the comments_work_queue view."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from app.db.pool import get_pool
+
+WORK_QUEUE_PAGE_SIZE = 2000
+
+
+async def iter_work_queue(
+    condition: str = "needs_vader OR needs_theme",
+    page_size: int = WORK_QUEUE_PAGE_SIZE,
+) -> AsyncIterator[list]:
+    """Yield pending comments page by page, prefetching the next page.
+
+    ``condition`` is a fixed SQL predicate over the view's flag columns.
+    Iterate inside ``contextlib.aclosing`` so an early exit cancels the prefetch.
+    """
+    pool = await get_pool()
+
+    async def fetch(after):
+        async with pool.acquire() as conn:
+            return await conn.fetch(
+                f"""SELECT id, text, needs_vader, needs_theme
+                    FROM comments_work_queue
+                    WHERE ({condition}) AND ($1::uuid IS NULL OR id > $1)
+                    ORDER BY id
+                    LIMIT $2""",
+                after, page_size,
+            )
+
+    page = await fetch(None)
+    next_page = None
+    try:
+        while page:
+            if len(page) == page_size:
+                next_page = asyncio.create_task(fetch(page[-1]["id"]))
+            yield page
+            page = await next_page if next_page else []
+            next_page = None
+    finally:
+        # The consumer stopped early: release the prefetch's pooled connection
+        if next_page:
+            next_page.cancel()
@@ -11,6 +11,8 @@ from app.db.migrations import run_migrations
 from app.db.pool import close_db, init_db
 from app.routers import analysis, analytics, health, scraping
 from app.scheduler.jobs import start_scheduler, stop_scheduler
+from app.services.llm import close_http_client
+from app.services.sentiment import shutdown_vader_executor
 
 
 @asynccontextmanager
@@ -30,6 +32,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     stop_scheduler()
+    await close_http_client()
+    shutdown_vader_executor()
     await close_db()
     logger.info("Application shutdown complete")
 
@@ -1,9 +1,10 @@
 """Pydantic schemas for API request/response models."""
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 # --- Health ---
@@ -182,7 +183,7 @@ class SuggestionItem(BaseModel):
     title: str
     description: str
     supporting_data: str | None = None
-    priority: str = "medium"
+    priority: Literal["high", "medium", "low"] = "medium"
     categoria: str | None = None
     acoes_concretas: list[str] | None = None
     exemplo_post: str | None = None
@@ -191,6 +192,13 @@ class SuggestionItem(BaseModel):
     para_quem: str | None = None
     impacto_esperado: str | None = None
 
+    @field_validator("priority", mode="before")
+    @classmethod
+    def _normalize_priority(cls, value):
+        """Lowercase the priority and default unknown values to medium."""
+        value = str(value or "").strip().lower()
+        return value if value in ("high", "medium", "low") else "medium"
+
 
 class SuggestionsResponse(BaseModel):
     suggestions: list[SuggestionItem]
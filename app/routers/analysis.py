@@ -2,11 +2,14 @@
 
 from fastapi import APIRouter, HTTPException, Query
 
+from app.core.config import settings
 from app.services.sentiment import (
     analyze_contextual_sentiment,
     analyze_unanalyzed_comments,
+    collect_reclassification_batch,
     get_sentiment_summary,
     run_llm_fallback,
+    submit_reclassification_batch,
 )
 
 router = APIRouter(prefix="/api/v1/analysis", tags=["analysis"])
@@ -27,11 +30,25 @@ async def sentiment_summary(candidate_id: str | None = Query(None)):
 
 @router.post("/sentiment/llm-fallback")
 async def llm_fallback():
-    """Reclassify ambiguous comments using LLM."""
+    """Reclassify ambiguous comments using LLM.
+
+    With LLM_USE_BATCH_API enabled this submits a Batch API job instead.
+    """
+    if settings.LLM_USE_BATCH_API:
+        batch_id = await submit_reclassification_batch()
+        if batch_id is None:
+            return {"batch_id": None, "message": "No comments submitted to LLM batch"}
+        return {"batch_id": batch_id, "message": f"Submitted LLM batch {batch_id}"}
     count = await run_llm_fallback()
     return {"reclassified": count, "message": f"Reclassified {count} comments with LLM"}
 
 
+@router.post("/sentiment/llm-fallback/batches/{batch_id}/collect")
+async def llm_fallback_collect(batch_id: str):
+    """Apply the results of a finished LLM Batch API job."""
+    return await collect_reclassification_batch(batch_id)
+
+
 @router.post("/sentiment/contextual/{post_id}")
 async def contextual_sentiment(post_id: str):
     """Get contextual sentiment analysis for a specific post."""
@@ -1,6 +1,7 @@
 """Analytics endpoints for the frontend dashboard."""
 
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 
 from app.services.analytics import (
     get_comparison,
@@ -12,14 +13,19 @@ from app.services.analytics import (
     get_wordcloud,
 )
 from app.services.suggestions import generate_suggestions
+from app.services.summary_cache import cached_summary
 
-router = APIRouter(prefix="/api/v1/analytics", tags=["analytics"])
+router = APIRouter(
+    prefix="/api/v1/analytics",
+    tags=["analytics"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.get("/overview")
 async def overview():
     """Get overview analytics for all candidates."""
-    return await get_overview()
+    return await cached_summary(("overview",), get_overview)
 
 
 @router.get("/sentiment-timeline")
@@ -29,19 +35,26 @@ async def sentiment_timeline(
     end_date: str | None = Query(None),
 ):
     """Get sentiment timeline data grouped by post."""
-    return await get_sentiment_timeline(candidate_id, start_date, end_date)
+    return await cached_summary(
+        ("sentiment-timeline", candidate_id, start_date, end_date),
+        lambda: get_sentiment_timeline(candidate_id, start_date, end_date),
+    )
 
 
 @router.get("/wordcloud")
 async def wordcloud(candidate_id: str | None = Query(None)):
     """Get word frequencies for wordcloud visualization."""
-    return await get_wordcloud(candidate_id)
+    return await cached_summary(
+        ("wordcloud", candidate_id), lambda: get_wordcloud(candidate_id)
+    )
 
 
 @router.get("/themes")
 async def themes(candidate_id: str | None = Query(None)):
     """Get theme distribution."""
-    return await get_themes(candidate_id)
+    return await cached_summary(
+        ("themes", candidate_id), lambda: get_themes(candidate_id)
+    )
 
 
 @router.get("/posts")
@@ -53,13 +66,16 @@ async def posts(
     offset: int = Query(0, ge=0),
 ):
     """Get posts with sentiment data."""
-    return await get_posts(candidate_id, sort_by, order, limit, offset)
+    return await cached_summary(
+        ("posts", candidate_id, sort_by, order, limit, offset),
+        lambda: get_posts(candidate_id, sort_by, order, limit, offset),
+    )
 
 
 @router.get("/comparison")
 async def comparison():
     """Get comparison data for all candidates."""
-    return await get_comparison()
+    return await cached_summary(("comparison",), get_comparison)
 
 
 @router.get("/competitive")
@@ -68,7 +84,10 @@ async def competitive(
     competitor_username: str = Query(...),
 ):
     """Compare two candidates head-to-head."""
-    return await get_competitive(our_username, competitor_username)
+    return await cached_summary(
+        ("competitive", our_username, competitor_username),
+        lambda: get_competitive(our_username, competitor_username),
+    )
 
 
 @router.post("/suggestions")
@@ -1,40 +1,91 @@
-"""Health check endpoint."""
+"""Health, liveness and readiness endpoints."""
+
+import time
+from datetime import datetime, timezone
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
+from app.core.config import settings
 from app.core.logging import logger
 from app.db.pool import get_pool
 from app.services.scraping import get_last_scrape_info
 
 router = APIRouter()
 
+# (checked_at, last_scrape) from the last probe that reached the database;
+# failed probes are never cached
+_probe_cache: tuple[float, dict | None] | None = None
+
+
+async def _probe_database() -> tuple[str, dict | None]:
+    """Ping the database and read the last scrape, reusing a recent success."""
+    global _probe_cache
+    if _probe_cache and time.monotonic() - _probe_cache[0] < settings.HEALTH_CACHE_TTL_SECONDS:
+        return "connected", _probe_cache[1]
 
-@router.get("/health")
-async def health_check():
-    # Check database
-    db_status = "disconnected"
     try:
         pool = await get_pool()
         async with pool.acquire() as conn:
             await conn.fetchval("SELECT 1")
-        db_status = "connected"
     except Exception as e:
         logger.error(f"Health check DB error: {e}")
-
-    # Check scheduler
-    from app.scheduler.jobs import scheduler
-    scheduler_status = "running" if scheduler and scheduler.running else "stopped"
+        return "disconnected", None
 
     # Last scrape
-    last_scrape = None
     try:
         last_scrape = await get_last_scrape_info()
-    except Exception:
-        pass
+    except Exception as e:
+        logger.error(f"Health check last scrape error: {e}")
+        return "connected", None
+
+    _probe_cache = (time.monotonic(), last_scrape)
+    return "connected", last_scrape
+
+
+def _is_stale(last_scrape: dict | None) -> bool:
+    """Whether the last successful scraping run finished longer ago than allowed."""
+    if not last_scrape or not last_scrape["last_success_at"]:
+        return True
+    last_success_at = datetime.fromisoformat(last_scrape["last_success_at"])
+    age = (datetime.now(timezone.utc) - last_success_at).total_seconds()
+    return age > settings.HEALTH_SCRAPE_MAX_AGE_SEC
+
+
+async def _readiness() -> dict:
+    """Database, scheduler and scrape freshness status."""
+    # Check database
+    db_status, last_scrape = await _probe_database()
+
+    # Check scheduler
+    from app.scheduler.jobs import scheduler
+    scheduler_status = "running" if scheduler and scheduler.running else "stopped"
 
     return {
         "status": "healthy" if db_status == "connected" else "degraded",
         "database": db_status,
         "scheduler": scheduler_status,
         "last_scrape": last_scrape,
+        "stale": _is_stale(last_scrape),
     }
+
+
+@router.get("/livez")
+async def liveness():
+    """Liveness probe: the process is serving requests. Touches no dependencies."""
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readiness():
+    """Readiness probe: 503 while the database is unreachable."""
+    body = await _readiness()
+    if body["database"] != "connected":
+        return JSONResponse(status_code=503, content=body)
+    return body
+
+
+@router.get("/health")
+async def health_check():
+    """Readiness details, always 200 for existing health checks."""
+    return await _readiness()
@@ -9,6 +9,9 @@ from app.services.scraping import is_pipeline_running, run_full_pipeline
 
 router = APIRouter(prefix="/api/v1/scraping", tags=["scraping"])
 
+# Strong references to in-flight pipeline tasks; the event loop only keeps weak ones
+_background_tasks: set[asyncio.Task] = set()
+
 
 @router.post("/run")
 async def trigger_scraping():
@@ -23,7 +26,9 @@ async def trigger_scraping():
         except Exception as e:
             logger.error(f"Background pipeline error: {e}")
 
-    asyncio.create_task(_run())
+    task = asyncio.create_task(_run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
     return {
         "status": "started",
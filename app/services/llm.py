@@ -0,0 +1,83 @@
+"""Shared HTTP client for LLM API calls."""
+
+import asyncio
+import random
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import logger
+
+OPENAI_API_URL = "https://api.openai.com/v1"
+
+_RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide LLM client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(90.0, connect=5.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared LLM client on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("LLM HTTP client closed")
+
+
+def llm_headers() -> dict:
+    """Authorization header for the OpenAI API."""
+    return {"Authorization": f"Bearer {settings.LLM_API_KEY}"}
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Seconds to wait before the next attempt, honouring Retry-After when sent."""
+    if response is not None:
+        try:
+            return min(float(response.headers["retry-after"]), 60.0)
+        except (KeyError, ValueError):
+            pass
+    return min(2 ** attempt, 30) * random.uniform(0.5, 1.0)
+
+
+async def request_with_retry(
+    method: str, url: str, idempotent: bool = True, **kwargs
+) -> httpx.Response:
+    """Send an LLM API request, retrying rate limits and transient failures.
+
+    Read timeouts are not retried: each one has already waited the full read
+    timeout. Non-idempotent requests are not retried on transport errors, as
+    the server may already have acted on them.
+    """
+    client = get_http_client()
+    for attempt in range(1, settings.LLM_MAX_ATTEMPTS + 1):
+        response = None
+        try:
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in _RETRYABLE_STATUS_CODES:
+                response.raise_for_status()
+                return response
+            if attempt == settings.LLM_MAX_ATTEMPTS:
+                response.raise_for_status()
+        except httpx.ReadTimeout:
+            raise
+        except httpx.TransportError:
+            if not idempotent or attempt == settings.LLM_MAX_ATTEMPTS:
+                raise
+
+        delay = _retry_delay(attempt, response)
+        reason = response.status_code if response is not None else "transport error"
+        logger.warning(
+            f"LLM request failed ({reason}), retrying in {delay:.1f}s (attempt {attempt})"
+        )
+        await asyncio.sleep(delay)
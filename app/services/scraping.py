@@ -1,16 +1,58 @@
 """Scraping service using Apify to fetch Instagram posts and comments."""
 
 import asyncio
+import functools
+import itertools
 import json
+import random
 import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from datetime import datetime, timezone
 from uuid import UUID
 
+import orjson
 from apify_client import ApifyClient
 
 from app.core.config import settings
 from app.core.logging import logger
 from app.db.pool import get_pool
+from app.db.work_queue import iter_work_queue
+from app.services.summary_cache import invalidate_summary_cache
+
+# Rows per batched INSERT statement
+UPSERT_BATCH_SIZE = 500
+# Apify dataset items mapped and written per chunk
+DATASET_CHUNK_SIZE = 200
+
+# Apify fields already stored in their own columns (or, for latestComments,
+# as comment rows) and therefore left out of raw_data
+_POST_MAPPED_KEYS = frozenset({
+    "id", "shortCode", "url", "caption", "likesCount", "commentsCount",
+    "type", "timestamp", "videoViewCount", "isSponsored", "latestComments",
+})
+_COMMENT_MAPPED_KEYS = frozenset({
+    "id", "text", "ownerUsername", "likesCount", "repliesCount", "timestamp",
+})
+
+# Apify post type (casefolded) -> media_type enum value
+_media_type = {
+    "image": "image",
+    "video": "video",
+    "sidecar": "carousel",
+    "carousel": "carousel",
+}.get
+
+# Actor run outcomes worth another attempt (None: the run could not be read);
+# ABORTED is left out as it usually means a deliberate abort or a credit/timeout limit
+_RETRYABLE_RUN_STATUSES = {None, "FAILED"}
+
+# Dedicated threads for the blocking Apify client, one per concurrent scrape,
+# so minutes-long actor runs never starve the loop's default executor
+_apify_executor = ThreadPoolExecutor(
+    max_workers=settings.SCRAPING_CONCURRENCY, thread_name_prefix="apify"
+)
 
 # Thread-safe lock for pipeline
 _pipeline_lock = asyncio.Lock()
@@ -26,7 +68,9 @@ async def get_last_scrape_info() -> dict | None:
     pool = await get_pool()
     async with pool.acquire() as conn:
         row = await conn.fetchrow(
-            "SELECT id, started_at, completed_at, status, posts_scraped, comments_scraped "
+            "SELECT id, started_at, completed_at, status, posts_scraped, comments_scraped, "
+            "(SELECT max(COALESCE(completed_at, started_at)) FROM scraping_runs "
+            "WHERE status IN ('success', 'partial')) AS last_success_at "
             "FROM scraping_runs ORDER BY started_at DESC LIMIT 1"
         )
         if not row:
@@ -38,6 +82,7 @@ async def get_last_scrape_info() -> dict | None:
             "status": row["status"],
             "posts_scraped": row["posts_scraped"],
             "comments_scraped": row["comments_scraped"],
+            "last_success_at": row["last_success_at"].isoformat() if row["last_success_at"] else None,
         }
 
 
@@ -73,185 +118,417 @@ async def run_full_pipeline() -> UUID:
             if not candidates:
                 logger.warning("No active candidates found")
 
-            for candidate in candidates:
-                cand_id = candidate["id"]
-                username = candidate["username"]
-                logger.info(f"Scraping posts for @{username}")
+            # One actor run covers every candidate; its items are routed by owner
+            candidate_ids = {c["username"]: c["id"] for c in candidates}
+            dataset_items = None
+            try:
+                if candidate_ids:
+                    dataset_items = await _run_scraper(candidate_ids)
+            except Exception as e:
+                logger.warning(f"Combined scrape failed, retrying per candidate: {e}")
+
+                # Scrape candidates concurrently, bounded to respect Apify limits;
+                # one actor run each, as the combined run was already retried
+                semaphore = asyncio.Semaphore(settings.SCRAPING_CONCURRENCY)
+
+                async def _scrape(candidate) -> tuple[int, int]:
+                    async with semaphore:
+                        return await _scrape_candidates(
+                            pool, run_id, {candidate["username"]: candidate["id"]},
+                            max_attempts=1,
+                        )
 
-                try:
-                    posts_count, comments_count = await _scrape_candidate(
-                        pool, run_id, cand_id, username
-                    )
+                results = await asyncio.gather(
+                    *(_scrape(candidate) for candidate in candidates),
+                    return_exceptions=True,
+                )
+                for candidate, result in zip(candidates, results):
+                    if isinstance(result, BaseException):
+                        error_msg = f"Error scraping @{candidate['username']}: {result}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+                        continue
+                    posts_count, comments_count = result
                     total_posts += posts_count
                     total_comments += comments_count
+
+            # The combined run succeeded: a storage error is recorded, not re-scraped,
+            # and the chunks already written keep their counts
+            if dataset_items is not None:
+                try:
+                    async for posts_count, comments_count in _store_dataset(
+                        pool, run_id, candidate_ids, dataset_items
+                    ):
+                        total_posts += posts_count
+                        total_comments += comments_count
                 except Exception as e:
-                    error_msg = f"Error scraping @{username}: {e}"
+                    error_msg = f"Error storing scraped items: {e}"
                     logger.error(error_msg)
                     errors.append(error_msg)
 
-            # Run sentiment analysis
+            # Read pending sentiment and theme work page by page, in a single pass
             from app.services.sentiment import analyze_unanalyzed_comments
-            analyzed = await analyze_unanalyzed_comments()
-            logger.info(f"Sentiment analysis: {analyzed} comments analyzed")
-
-            # Run theme classification
             from app.services.themes import classify_unclassified_comments
-            themed = await classify_unclassified_comments()
+            analyzed = themed = 0
+            async with aclosing(iter_work_queue()) as pages:
+                async for page in pages:
+                    analyzed += await analyze_unanalyzed_comments(
+                        [row for row in page if row["needs_vader"]]
+                    )
+                    themed += await classify_unclassified_comments(
+                        [row for row in page if row["needs_theme"]]
+                    )
+            logger.info(f"Sentiment analysis: {analyzed} comments analyzed")
             logger.info(f"Theme classification: {themed} comments classified")
 
             duration = round(time.time() - start_time, 2)
             status = "partial" if errors else "success"
 
-            async with pool.acquire() as conn:
-                await conn.execute(
-                    """UPDATE scraping_runs
-                       SET status = $1, completed_at = NOW(),
-                           posts_scraped = $2, comments_scraped = $3,
-                           duration_seconds = $4, errors = $5::jsonb
-                       WHERE id = $6""",
-                    status, total_posts, total_comments,
-                    duration, json.dumps(errors) if errors else None, run_id,
-                )
+            await _finish_run(
+                pool, run_id, status, errors,
+                posts_scraped=total_posts,
+                comments_scraped=total_comments,
+                duration=duration,
+            )
 
             logger.info(
                 f"Pipeline complete: {total_posts} posts, "
                 f"{total_comments} comments in {duration}s"
             )
+            invalidate_summary_cache()
 
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
-            async with pool.acquire() as conn:
-                await conn.execute(
-                    """UPDATE scraping_runs
-                       SET status = 'failed', completed_at = NOW(),
-                           errors = $1::jsonb
-                       WHERE id = $2""",
-                    json.dumps([str(e)]), run_id,
-                )
+            await _finish_run(
+                pool, run_id, "failed", [*errors, str(e)],
+                posts_scraped=total_posts,
+                comments_scraped=total_comments,
+                duration=round(time.time() - start_time, 2),
+            )
+            invalidate_summary_cache()
             raise
 
         return run_id
 
 
-async def _scrape_candidate(
-    pool, run_id: UUID, candidate_id: UUID, username: str
+async def _finish_run(
+    pool,
+    run_id: UUID,
+    status: str,
+    errors: list[str],
+    posts_scraped: int | None = None,
+    comments_scraped: int | None = None,
+    duration: float | None = None,
+) -> None:
+    """Record the outcome of a scraping run in a single UPDATE.
+
+    Columns passed as None keep their current value.
+    """
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """UPDATE scraping_runs
+               SET status = $1, completed_at = NOW(),
+                   posts_scraped = COALESCE($2, posts_scraped),
+                   comments_scraped = COALESCE($3, comments_scraped),
+                   duration_seconds = COALESCE($4, duration_seconds),
+                   errors = $5::jsonb
+               WHERE id = $6""",
+            status, posts_scraped, comments_scraped, duration,
+            json.dumps(errors) if errors else None, run_id,
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_apify_client() -> ApifyClient:
+    """Return the process-wide Apify client.
+
+    Reusing it keeps the underlying HTTP connections alive between runs; its
+    httpx-based transport is safe to share across the scraping threads.
+    """
+    return ApifyClient(settings.APIFY_TOKEN)
+
+
+async def _scrape_candidates(
+    pool, run_id: UUID, candidate_ids: dict[str, UUID], max_attempts: int | None = None
 ) -> tuple[int, int]:
-    """Scrape posts and comments for a single candidate. Returns (posts, comments) count."""
+    """Scrape posts and comments for candidates in one actor run. Returns (posts, comments) count."""
+    dataset_items = await _run_scraper(candidate_ids, max_attempts)
+    posts_count = 0
+    comments_count = 0
+    async for chunk_posts, chunk_comments in _store_dataset(
+        pool, run_id, candidate_ids, dataset_items
+    ):
+        posts_count += chunk_posts
+        comments_count += chunk_comments
+    return posts_count, comments_count
+
+
+async def _run_scraper(
+    candidate_ids: dict[str, UUID], max_attempts: int | None = None
+) -> Iterator[dict]:
+    """Run the post scraper actor for candidates. Returns an iterator over its dataset."""
     if not settings.APIFY_TOKEN:
         logger.warning("APIFY_TOKEN not set, skipping scraping")
-        return 0, 0
+        return iter(())
 
-    client = ApifyClient(settings.APIFY_TOKEN)
+    client = _get_apify_client()
+    handles = ", ".join(f"@{username}" for username in candidate_ids)
 
     # Run Instagram Post Scraper
     run_input = {
-        "username": [username],
+        "username": list(candidate_ids),
         "resultsLimit": 30,
     }
 
-    logger.info(f"Starting Apify actor for @{username}")
-    actor_run = client.actor("apify/instagram-post-scraper").call(
-        run_input=run_input, timeout_secs=300
-    )
+    logger.info(f"Starting Apify actor for {handles}")
+    actor_run = await _call_actor(client, run_input, max_attempts)
+
+    return client.dataset(actor_run["defaultDatasetId"]).iterate_items()
+
+
+async def _store_dataset(
+    pool, run_id: UUID, candidate_ids: dict[str, UUID], dataset_items: Iterator[dict]
+) -> AsyncIterator[tuple[int, int]]:
+    """Write an actor's dataset chunk by chunk, yielding (posts, comments) per chunk."""
+    # Stream the dataset in chunks so memory stays bounded by the chunk size
+    items_count = 0
+    while items := await _run_blocking(_take, dataset_items, DATASET_CHUNK_SIZE):
+        items_count += len(items)
+        async with pool.acquire() as conn:
+            counts = await _store_items(conn, run_id, candidate_ids, items)
+        yield counts
+
+    handles = ", ".join(f"@{username}" for username in candidate_ids)
+    logger.info(f"Got {items_count} items from Apify for {handles}")
+
+
+def _candidate_for(item: dict, candidate_ids: dict[str, UUID]) -> UUID | None:
+    """Resolve which scraped candidate an Apify post item belongs to."""
+    if len(candidate_ids) == 1:
+        return next(iter(candidate_ids.values()))
+    owner = item.get("ownerUsername") or ""
+    if owner not in candidate_ids:
+        # Fall back to the profile URL the actor was given
+        owner = (item.get("inputUrl") or "").rstrip("/").rsplit("/", 1)[-1]
+    return candidate_ids.get(owner)
+
+
+async def _call_actor(
+    client: ApifyClient, run_input: dict, max_attempts: int | None = None
+) -> dict:
+    """Run the post scraper actor, retrying failed runs with exponential backoff.
+
+    Transient HTTP errors (429/5xx) are already retried inside the Apify client;
+    this covers actor runs that start but end FAILED. ``max_attempts`` defaults
+    to APIFY_MAX_ATTEMPTS.
+    """
+    if max_attempts is None:
+        max_attempts = settings.APIFY_MAX_ATTEMPTS
+    for attempt in range(1, max_attempts + 1):
+        # The Apify client is synchronous; keep its blocking calls off the event loop
+        actor_run = await _run_blocking(
+            client.actor("apify/instagram-post-scraper").call,
+            run_input=run_input,
+            timeout_secs=300,
+        )
+        status = actor_run["status"] if actor_run else None
+        if status not in _RETRYABLE_RUN_STATUSES:
+            return actor_run
+
+        if attempt == max_attempts:
+            raise RuntimeError(f"Apify actor run ended with status {status}")
+        delay = min(2 ** attempt, 30) * random.uniform(0.5, 1.0)
+        logger.warning(
+            f"Apify actor run ended with status {status}, "
+            f"retrying in {delay:.1f}s (attempt {attempt})"
+        )
+        await asyncio.sleep(delay)
 
-    items = list(
-        client.dataset(actor_run["defaultDatasetId"]).iterate_items()
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking Apify client call on the dedicated scraping threads."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _apify_executor, functools.partial(func, *args, **kwargs)
     )
-    logger.info(f"Got {len(items)} items from Apify for @{username}")
 
-    posts_count = 0
-    comments_count = 0
 
-    async with pool.acquire() as conn:
-        for item in items:
-            instagram_id = item.get("id", item.get("shortCode", ""))
-            if not instagram_id:
+def _parse_ts(raw) -> datetime | None:
+    """Parse an Apify timestamp given as ISO-8601 text or epoch seconds."""
+    if not raw:
+        return None
+    try:
+        if isinstance(raw, (int, float)):
+            return datetime.fromtimestamp(raw, tz=timezone.utc)
+        # Python 3.11+ accepts the trailing "Z" directly
+        return datetime.fromisoformat(raw)
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+
+
+def _strip_mapped(item: dict, mapped_keys: frozenset[str]) -> dict:
+    """Drop fields that already have their own column from a raw Apify item."""
+    return {key: value for key, value in item.items() if key not in mapped_keys}
+
+
+def _take(iterator: Iterator[dict], size: int) -> list[dict]:
+    """Pull up to size items from an iterator."""
+    return list(itertools.islice(iterator, size))
+
+
+async def _store_items(
+    conn, run_id: UUID, candidate_ids: dict[str, UUID], items: list[dict]
+) -> tuple[int, int]:
+    """Write the posts and comments of a chunk of Apify items. Returns (posts, comments) count."""
+    # Keyed by instagram_id so a post repeated in the chunk is upserted once
+    post_rows: dict[str, tuple] = {}
+    post_comments: dict[str, list[dict]] = {}
+
+    for item in items:
+        instagram_id = item.get("id", item.get("shortCode", ""))
+        if not instagram_id:
+            continue
+        instagram_id = str(instagram_id)
+
+        candidate_id = _candidate_for(item, candidate_ids)
+        if candidate_id is None:
+            logger.debug(f"Skipping post {instagram_id} from unknown owner")
+            continue
+
+        shortcode = item.get("shortCode", "")
+        url = item.get("url", f"https://www.instagram.com/p/{shortcode}/")
+        caption = item.get("caption", "")
+        like_count = item.get("likesCount", 0) or 0
+        comment_count_val = item.get("commentsCount", 0) or 0
+
+        mt = _media_type(str(item.get("type", "")).casefold(), "unknown")
+
+        posted_at = _parse_ts(item.get("timestamp"))
+        video_views = item.get("videoViewCount")
+        is_sponsored = item.get("isSponsored", False) or False
+
+        post_rows[instagram_id] = (
+            candidate_id, instagram_id, url, shortcode, caption, like_count,
+            comment_count_val, mt, is_sponsored, video_views, posted_at,
+            orjson.dumps(_strip_mapped(item, _POST_MAPPED_KEYS)).decode(),
+        )
+        post_comments[instagram_id] = item.get("latestComments", []) or []
+
+    post_ids = await _upsert_posts(conn, run_id, list(post_rows.values()))
+
+    comment_rows: list[tuple] = []
+    for instagram_id, item_comments in post_comments.items():
+        post_id = post_ids[instagram_id]
+        for comment in item_comments:
+            comment_ig_id = comment.get("id", "")
+            if not comment_ig_id:
                 continue
 
-            shortcode = item.get("shortCode", "")
-            url = item.get("url", f"https://www.instagram.com/p/{shortcode}/")
-            caption = item.get("caption", "")
-            like_count = item.get("likesCount", 0) or 0
-            comment_count_val = item.get("commentsCount", 0) or 0
-
-            # Determine media type
-            item_type = item.get("type", "unknown")
-            if item_type == "Video":
-                mt = "video"
-            elif item_type == "Sidecar":
-                mt = "carousel"
-            elif item_type == "Image":
-                mt = "image"
-            else:
-                mt = "unknown"
+            comment_text = comment.get("text", "")
+            if not comment_text:
+                continue
 
-            posted_at = item.get("timestamp")
-            if posted_at and isinstance(posted_at, str):
-                try:
-                    posted_at = datetime.fromisoformat(
-                        posted_at.replace("Z", "+00:00")
-                    )
-                except (ValueError, TypeError):
-                    posted_at = None
-
-            video_views = item.get("videoViewCount")
-            is_sponsored = item.get("isSponsored", False) or False
-
-            # Upsert post
-            post_row = await conn.fetchrow(
-                """INSERT INTO posts
-                   (candidate_id, scraping_run_id, instagram_id, url, shortcode,
-                    caption, like_count, comment_count, media_type, is_sponsored,
-                    video_view_count, posted_at, raw_data)
-                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9::media_type, $10, $11, $12, $13::jsonb)
-                   ON CONFLICT (instagram_id) DO UPDATE SET
-                    like_count = EXCLUDED.like_count,
-                    comment_count = EXCLUDED.comment_count,
-                    updated_at = NOW()
-                   RETURNING id""",
-                candidate_id, run_id, str(instagram_id), url, shortcode,
-                caption, like_count, comment_count_val, mt, is_sponsored,
-                video_views, posted_at, json.dumps(item),
-            )
-            post_id = post_row["id"]
-            posts_count += 1
-
-            # Process comments from the item
-            item_comments = item.get("latestComments", []) or []
-            for comment in item_comments:
-                comment_ig_id = comment.get("id", "")
-                if not comment_ig_id:
-                    continue
-
-                comment_text = comment.get("text", "")
-                if not comment_text:
-                    continue
-
-                author = comment.get("ownerUsername", comment.get("owner", {}).get("username"))
-                c_like_count = comment.get("likesCount", 0) or 0
-                c_reply_count = comment.get("repliesCount", 0) or 0
-                commented_at = comment.get("timestamp")
-                if commented_at and isinstance(commented_at, str):
-                    try:
-                        commented_at = datetime.fromisoformat(
-                            commented_at.replace("Z", "+00:00")
-                        )
-                    except (ValueError, TypeError):
-                        commented_at = None
+            author = comment.get("ownerUsername", comment.get("owner", {}).get("username"))
+            c_like_count = comment.get("likesCount", 0) or 0
+            c_reply_count = comment.get("repliesCount", 0) or 0
+            commented_at = _parse_ts(comment.get("timestamp"))
 
-                try:
-                    await conn.execute(
-                        """INSERT INTO comments
-                           (post_id, scraping_run_id, instagram_id, text,
-                            author_username, like_count, reply_count, commented_at, raw_data)
-                           VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9::jsonb)
-                           ON CONFLICT (instagram_id) DO NOTHING""",
-                        post_id, run_id, str(comment_ig_id), comment_text,
-                        author, c_like_count, c_reply_count, commented_at,
-                        json.dumps(comment),
-                    )
-                    comments_count += 1
-                except Exception as e:
-                    logger.debug(f"Comment insert error (likely duplicate): {e}")
+            comment_rows.append((
+                post_id, str(comment_ig_id), comment_text, author,
+                c_like_count, c_reply_count, commented_at,
+                orjson.dumps(_strip_mapped(comment, _COMMENT_MAPPED_KEYS)).decode(),
+            ))
 
-    return posts_count, comments_count
+    comments_count = await _insert_comments(conn, run_id, comment_rows)
+
+    return len(post_ids), comments_count
+
+
+async def _upsert_posts(conn, run_id: UUID, rows: list[tuple]) -> dict[str, UUID]:
+    """Upsert posts in batches. Returns a map of instagram_id -> post id.
+
+    Posts whose counters are unchanged since the last scrape are not rewritten.
+    """
+    post_ids: dict[str, UUID] = {}
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+
+        existing = await conn.fetch(
+            """SELECT id, instagram_id, like_count, comment_count
+               FROM posts WHERE instagram_id = ANY($1::text[])""",
+            [row[1] for row in batch],
+        )
+        stored = {
+            r["instagram_id"]: (r["id"], r["like_count"], r["comment_count"])
+            for r in existing
+        }
+
+        changed = []
+        for row in batch:
+            _, instagram_id, _, _, _, like_count, comment_count, *_ = row
+            current = stored.get(instagram_id)
+            if current and current[1:] == (like_count, comment_count):
+                post_ids[instagram_id] = current[0]
+            else:
+                changed.append(row)
+        if not changed:
+            continue
+
+        columns = list(zip(*changed))
+        upserted = await conn.fetch(
+            """INSERT INTO posts
+               (candidate_id, scraping_run_id, instagram_id, url, shortcode,
+                caption, like_count, comment_count, media_type, is_sponsored,
+                video_view_count, posted_at, raw_data)
+               SELECT t.candidate_id, $1, t.instagram_id, t.url, t.shortcode,
+                      t.caption, t.like_count, t.comment_count,
+                      t.media_type::media_type, t.is_sponsored,
+                      t.video_view_count, t.posted_at, t.raw_data::jsonb
+               FROM unnest(
+                 $2::uuid[], $3::text[], $4::text[], $5::text[], $6::text[],
+                 $7::int[], $8::int[], $9::text[], $10::bool[], $11::int[],
+                 $12::timestamptz[], $13::text[]
+               ) AS t(candidate_id, instagram_id, url, shortcode, caption,
+                      like_count, comment_count, media_type, is_sponsored,
+                      video_view_count, posted_at, raw_data)
+               ON CONFLICT (instagram_id) DO UPDATE SET
+                like_count = EXCLUDED.like_count,
+                comment_count = EXCLUDED.comment_count,
+                updated_at = NOW()
+               RETURNING id, instagram_id""",
+            run_id, *columns,
+        )
+        post_ids.update({row["instagram_id"]: row["id"] for row in upserted})
+    return post_ids
+
+
+async def _insert_comments(conn, run_id: UUID, rows: list[tuple]) -> int:
+    """Insert comments in batches, skipping ones already stored. Returns count."""
+    sql = """INSERT INTO comments
+             (post_id, scraping_run_id, instagram_id, text,
+              author_username, like_count, reply_count, commented_at, raw_data)
+             SELECT t.post_id, $1, t.instagram_id, t.text, t.author_username,
+                    t.like_count, t.reply_count, t.commented_at, t.raw_data::jsonb
+             FROM unnest(
+               $2::uuid[], $3::text[], $4::text[], $5::text[], $6::int[],
+               $7::int[], $8::timestamptz[], $9::text[]
+             ) AS t(post_id, instagram_id, text, author_username, like_count,
+                    reply_count, commented_at, raw_data)
+             ON CONFLICT (instagram_id) DO NOTHING"""
+
+    count = 0
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+        try:
+            await conn.execute(sql, run_id, *zip(*batch))
+            count += len(batch)
+        except Exception as e:
+            # Retry row by row so one bad comment doesn't drop the whole batch
+            logger.warning(f"Batched comment insert failed, retrying per row: {e}")
+            for row in batch:
+                try:
+                    await conn.execute(sql, run_id, *([value] for value in row))
+                    count += 1
+                except Exception as row_error:
+                    logger.debug(f"Comment insert error: {row_error}")
+    return count
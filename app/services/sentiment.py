@@ -1,16 +1,76 @@
 """Sentiment analysis using VADER and LLM fallback."""
 
-import json
+import asyncio
+import functools
+import hashlib
+import multiprocessing
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
 from uuid import UUID
 
-import httpx
+import orjson
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from app.core.config import settings
 from app.core.logging import logger
 from app.db.pool import get_pool
+from app.db.work_queue import iter_work_queue
+from app.services.llm import OPENAI_API_URL, llm_headers, request_with_retry
 
 _analyzer = SentimentIntensityAnalyzer()
+# Comments repeat verbatim (emoji strings, greetings, spam); score each text once
+_polarity_scores = functools.lru_cache(maxsize=8192)(_analyzer.polarity_scores)
+
+# Comments per worker task when scoring VADER in the process pool
+VADER_CHUNK_SIZE = 500
+
+_vader_executor: ProcessPoolExecutor | None = None
+
+# Ambiguous comments sent per Batch API job
+BATCH_API_MAX_REQUESTS = 5000
+# Batch API job statuses after which no output will appear
+_BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# USD per 1K (prompt, completion) tokens, for usage logging
+LLM_PRICES_PER_1K_TOKENS = {
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4o": (0.0025, 0.01),
+}
+
+# URLs, mentions, hashtags and emoji/punctuation carry no signal for the LLM
+_NOISE_RE = re.compile(r"https?://\S+|@\w+|#\w+|[^\w\s]")
+
+# Structured output schema for batched sentiment classification
+SENTIMENT_SCHEMA = {
+    "name": "sentiment_results",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "index": {"type": "integer"},
+                        "label": {
+                            "type": "string",
+                            "enum": ["positive", "negative", "neutral"],
+                        },
+                        "confidence": {"type": "number"},
+                    },
+                    "required": ["index", "label", "confidence"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    },
+}
 
 
 def classify_vader(compound: float) -> str:
@@ -22,37 +82,95 @@ def classify_vader(compound: float) -> str:
     return "neutral"
 
 
-async def analyze_unanalyzed_comments() -> int:
-    """Run VADER sentiment on all comments without sentiment scores. Returns count."""
-    pool = await get_pool()
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            """SELECT c.id, c.text FROM comments c
-               LEFT JOIN sentiment_scores s ON s.comment_id = c.id
-               WHERE s.id IS NULL AND c.text IS NOT NULL AND c.text != ''"""
+def _score_texts(texts: list[str]) -> list[tuple[float, float, float, float, str]]:
+    """Score a chunk of texts with VADER. Runs inside a worker process."""
+    results = []
+    for text in texts:
+        scores = _polarity_scores(text)
+        compound = scores["compound"]
+        results.append(
+            (compound, scores["pos"], scores["neg"], scores["neu"], classify_vader(compound))
+        )
+    return results
+
+
+def _get_vader_executor() -> ProcessPoolExecutor:
+    """Return the VADER worker pool, starting it on first use."""
+    global _vader_executor
+    if _vader_executor is None:
+        _vader_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("forkserver"),
         )
+    return _vader_executor
+
+
+def shutdown_vader_executor() -> None:
+    """Stop the VADER worker pool on application shutdown."""
+    global _vader_executor
+    if _vader_executor is not None:
+        _vader_executor.shutdown(cancel_futures=True)
+        _vader_executor = None
+
+
+async def analyze_unanalyzed_comments(rows: list | None = None) -> int:
+    """Run VADER sentiment on all comments without sentiment scores. Returns count.
+
+    The pipeline passes one page of ``comments_work_queue``; otherwise the
+    queue is read page by page.
+    """
+    if rows is None:
+        count = 0
+        async with aclosing(iter_work_queue("needs_vader")) as pages:
+            async for page in pages:
+                count += await analyze_unanalyzed_comments(page)
+        return count
 
     if not rows:
         return 0
 
+    # VADER is pure Python and holds the GIL, so shard the work across processes
+    row_chunks = [
+        rows[i:i + VADER_CHUNK_SIZE] for i in range(0, len(rows), VADER_CHUNK_SIZE)
+    ]
+    if len(rows) < VADER_CHUNK_SIZE:
+        # Not worth the IPC overhead; keep the event loop free with a thread
+        partials = [
+            await asyncio.to_thread(_score_texts, [row["text"] for row in rows])
+        ]
+    else:
+        loop = asyncio.get_running_loop()
+        executor = _get_vader_executor()
+        partials = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, _score_texts, [row["text"] for row in chunk]
+                )
+                for chunk in row_chunks
+            )
+        )
+
+    # One multi-row INSERT per chunk
     count = 0
+    pool = await get_pool()
     async with pool.acquire() as conn:
-        for row in rows:
-            text = row["text"]
-            scores = _analyzer.polarity_scores(text)
-            compound = scores["compound"]
-            label = classify_vader(compound)
-
+        for chunk, scored in zip(row_chunks, partials):
+            compounds, positives, negatives, neutrals, labels = zip(*scored)
             await conn.execute(
                 """INSERT INTO sentiment_scores
                    (comment_id, vader_compound, vader_positive, vader_negative,
                     vader_neutral, vader_label, final_label)
-                   VALUES ($1, $2, $3, $4, $5, $6::sentiment_label, $7::sentiment_label)
+                   SELECT t.comment_id, t.compound, t.pos, t.neg, t.neu,
+                          t.label::sentiment_label, t.label::sentiment_label
+                   FROM unnest(
+                     $1::uuid[], $2::float8[], $3::float8[], $4::float8[],
+                     $5::float8[], $6::text[]
+                   ) AS t(comment_id, compound, pos, neg, neu, label)
                    ON CONFLICT (comment_id) DO NOTHING""",
-                row["id"], compound, scores["pos"], scores["neg"],
-                scores["neu"], label, label,
+                [row["id"] for row in chunk],
+                compounds, positives, negatives, neutrals, labels,
             )
-            count += 1
+            count += len(chunk)
 
     logger.info(f"VADER analyzed {count} comments")
     return count
@@ -69,18 +187,14 @@ async def get_sentiment_summary(candidate_id: str | None = None) -> dict:
                      COUNT(*) FILTER (WHERE s.final_label = 'positive') as positive,
                      COUNT(*) FILTER (WHERE s.final_label = 'negative') as negative,
                      COUNT(*) FILTER (WHERE s.final_label = 'neutral') as neutral,
-                     COALESCE(AVG(s.vader_compound), 0) as avg_compound
+                     COALESCE(AVG(s.vader_compound), 0) as avg_compound,
+                     (SELECT username FROM candidates WHERE id = $1::uuid) as username
                    FROM sentiment_scores s
                    JOIN comments c ON c.id = s.comment_id
                    JOIN posts p ON p.id = c.post_id
                    WHERE p.candidate_id = $1::uuid""",
                 candidate_id,
             )
-            # Get candidate info
-            cand = await conn.fetchrow(
-                "SELECT username FROM candidates WHERE id = $1::uuid",
-                candidate_id,
-            )
         else:
             row = await conn.fetchrow(
                 """SELECT
@@ -91,7 +205,6 @@ async def get_sentiment_summary(candidate_id: str | None = None) -> dict:
                      COALESCE(AVG(vader_compound), 0) as avg_compound
                    FROM sentiment_scores"""
             )
-            cand = None
 
         return {
             "total_comments": row["total"],
@@ -102,56 +215,285 @@ async def get_sentiment_summary(candidate_id: str | None = None) -> dict:
             },
             "average_compound": round(float(row["avg_compound"]), 4),
             "candidate_id": candidate_id,
-            "candidate_username": cand["username"] if cand else None,
+            "candidate_username": row["username"] if candidate_id else None,
         }
 
 
-async def run_llm_fallback() -> int:
-    """Reclassify ambiguous comments (near-zero VADER) using LLM."""
-    if not settings.LLM_API_KEY:
-        logger.warning("LLM_API_KEY not set, skipping LLM fallback")
-        return 0
+async def _fetch_ambiguous(pool, limit: int, after: UUID | None = None) -> list:
+    """Read ambiguous (near-zero VADER) comments not yet seen by the LLM, by score id.
 
-    pool = await get_pool()
+    Comments already submitted to a pending Batch API job are left out.
+    """
     async with pool.acquire() as conn:
-        rows = await conn.fetch(
+        return await conn.fetch(
             """SELECT s.id as score_id, c.text, s.vader_compound
                FROM sentiment_scores s
                JOIN comments c ON c.id = s.comment_id
                WHERE s.llm_label IS NULL
+                 AND s.llm_batch_id IS NULL
                  AND s.vader_compound > -0.05
                  AND s.vader_compound < 0.05
                  AND LENGTH(c.text) > 20
-               LIMIT 50"""
+                 AND ($2::uuid IS NULL OR s.id > $2)
+               ORDER BY s.id
+               LIMIT $1""",
+            limit, after,
         )
 
-    if not rows:
+
+async def _apply_llm_labels(
+    pool, score_ids: list, labels: list[str], confidences: list[float]
+) -> None:
+    """Write LLM labels to sentiment_scores in one statement."""
+    if not score_ids:
+        return
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """UPDATE sentiment_scores s
+               SET llm_label = u.label::sentiment_label,
+                   llm_confidence = u.confidence,
+                   llm_model = $4,
+                   final_label = u.label::sentiment_label,
+                   updated_at = NOW()
+               FROM unnest($1::uuid[], $2::text[], $3::float8[])
+                    AS u(id, label, confidence)
+               WHERE s.id = u.id""",
+            score_ids, labels, confidences, settings.LLM_MODEL,
+        )
+
+
+async def run_llm_fallback() -> int:
+    """Reclassify ambiguous comments (near-zero VADER) using LLM."""
+    if not settings.LLM_API_KEY:
+        logger.warning("LLM_API_KEY not set, skipping LLM fallback")
         return 0
 
-    reclassified = 0
-    for row in rows:
+    pool = await get_pool()
+    queue: asyncio.Queue[list | None] = asyncio.Queue(maxsize=2)
+    workers = settings.LLM_MAX_CONCURRENCY
+    reclassified = skipped_trivial = failed = 0
+    usage = Counter()
+
+    # The next page is read while earlier pages are with the LLM
+    async def _produce():
+        nonlocal skipped_trivial
+        after, remaining = None, settings.LLM_FALLBACK_MAX_COMMENTS
         try:
-            label, confidence = await _call_llm_sentiment(row["text"])
-            if label and confidence >= 0.7:
-                async with pool.acquire() as conn:
-                    await conn.execute(
-                        """UPDATE sentiment_scores
-                           SET llm_label = $1::sentiment_label,
-                               llm_confidence = $2,
-                               llm_model = $3,
-                               final_label = $1::sentiment_label,
-                               updated_at = NOW()
-                           WHERE id = $4""",
-                        label, confidence, settings.LLM_MODEL, row["score_id"],
-                    )
-                reclassified += 1
+            while remaining > 0:
+                page = await _fetch_ambiguous(pool, settings.LLM_BATCH_SIZE, after)
+                if not page:
+                    break
+                after = page[-1]["score_id"]
+                worth = [row for row in page if _is_worth_llm(row["text"])]
+                skipped_trivial += len(page) - len(worth)
+                if worth:
+                    await queue.put(worth[:remaining])
+                    remaining -= len(worth[:remaining])
         except Exception as e:
-            logger.error(f"LLM fallback error: {e}")
-
-    logger.info(f"LLM reclassified {reclassified} comments")
+            logger.error(f"LLM fallback read error: {e}")
+        finally:
+            for _ in range(workers):
+                await queue.put(None)
+
+    # A failed page is logged and counted; the other pages carry on
+    async def _consume():
+        nonlocal reclassified, failed
+        while (page := await queue.get()) is not None:
+            try:
+                reclassified += await _reclassify_page(pool, page, usage)
+            except Exception as e:
+                failed += len(page)
+                logger.error(f"LLM fallback error for {len(page)} comments: {e}")
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_produce())
+        for _ in range(workers):
+            tg.create_task(_consume())
+
+    logger.info(
+        f"LLM reclassified {reclassified} comments, failed {failed}, "
+        f"skipped {skipped_trivial} without enough words; {_usage_summary(usage)}"
+    )
     return reclassified
 
 
+async def _reclassify_page(pool, rows: list, usage: Counter) -> int:
+    """Classify one page of ambiguous comments and store confident labels."""
+    # Serve repeated texts from the cache; only distinct misses go to the LLM
+    hashes = [_text_hash(row["text"]) for row in rows]
+    async with pool.acquire() as conn:
+        cached_rows = await conn.fetch(
+            """SELECT text_hash, label::text, confidence FROM llm_sentiment_cache
+               WHERE model = $1 AND text_hash = ANY($2::bytea[])""",
+            settings.LLM_MODEL, list(set(hashes)),
+        )
+    results: dict[bytes, tuple[str | None, float]] = {
+        r["text_hash"]: (r["label"], r["confidence"]) for r in cached_rows
+    }
+    pending: dict[bytes, str] = {}
+    for text_hash, row in zip(hashes, rows):
+        if text_hash not in results:
+            pending.setdefault(text_hash, row["text"])
+
+    fresh: dict[bytes, tuple[str | None, float]] = {}
+    if pending:
+        try:
+            fresh = dict(zip(
+                pending, await _call_llm_sentiment_batch(list(pending.values()), usage)
+            ))
+        except Exception as e:
+            # Logged once for the whole batch; its rows are left for the next run
+            logger.error(f"LLM fallback error for {len(pending)} comments: {e}")
+    results.update(fresh)
+
+    new_entries = [(h, result) for h, result in fresh.items() if result[0]]
+    if new_entries:
+        async with pool.acquire() as conn:
+            await conn.execute(
+                """INSERT INTO llm_sentiment_cache (text_hash, model, label, confidence)
+                   SELECT t.text_hash, $4, t.label::sentiment_label, t.confidence
+                   FROM unnest($1::bytea[], $2::text[], $3::float8[])
+                        AS t(text_hash, label, confidence)
+                   ON CONFLICT (text_hash, model) DO NOTHING""",
+                [h for h, _ in new_entries],
+                [label for _, (label, _) in new_entries],
+                [confidence for _, (_, confidence) in new_entries],
+                settings.LLM_MODEL,
+            )
+
+    score_ids, labels, confidences = [], [], []
+    for text_hash, row in zip(hashes, rows):
+        if text_hash not in results:
+            continue
+        label, confidence = results[text_hash]
+        if label and confidence >= 0.7:
+            score_ids.append(row["score_id"])
+            labels.append(label)
+            confidences.append(confidence)
+
+    await _apply_llm_labels(pool, score_ids, labels, confidences)
+    return len(score_ids)
+
+
+async def submit_reclassification_batch() -> str | None:
+    """Submit ambiguous comments to the OpenAI Batch API. Returns the batch id."""
+    if not settings.LLM_API_KEY:
+        logger.warning("LLM_API_KEY not set, skipping LLM batch submission")
+        return None
+
+    pool = await get_pool()
+    rows = [
+        row for row in await _fetch_ambiguous(pool, BATCH_API_MAX_REQUESTS)
+        if _is_worth_llm(row["text"])
+    ]
+    if not rows:
+        return None
+
+    lines = b"\n".join(
+        orjson.dumps({
+            "custom_id": str(row["score_id"]),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _sentiment_request_body([row["text"]]),
+        })
+        for row in rows
+    )
+    upload = await request_with_retry(
+        "POST",
+        f"{OPENAI_API_URL}/files",
+        headers=llm_headers(),
+        data={"purpose": "batch"},
+        files={"file": ("reclassification.jsonl", lines, "application/jsonl")},
+    )
+
+    # Creating a batch is not idempotent: a retried timeout could start a second job
+    response = await request_with_retry(
+        "POST",
+        f"{OPENAI_API_URL}/batches",
+        idempotent=False,
+        headers=llm_headers(),
+        json={
+            "input_file_id": upload.json()["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        },
+    )
+    batch_id = response.json()["id"]
+
+    # Mark the rows so neither a new submission nor the live fallback labels them again
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "UPDATE sentiment_scores SET llm_batch_id = $1 WHERE id = ANY($2::uuid[])",
+            batch_id, [row["score_id"] for row in rows],
+        )
+
+    logger.info(f"Submitted LLM batch {batch_id} with {len(rows)} comments")
+    return batch_id
+
+
+async def _release_batch_rows(pool, batch_id: str) -> None:
+    """Unmark a finished batch's rows; those still unlabeled become eligible again."""
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "UPDATE sentiment_scores SET llm_batch_id = NULL WHERE llm_batch_id = $1",
+            batch_id,
+        )
+
+
+async def collect_reclassification_batch(batch_id: str) -> dict:
+    """Apply a finished Batch API job to sentiment_scores. Returns status and count."""
+    if not settings.LLM_API_KEY:
+        logger.warning("LLM_API_KEY not set, skipping LLM batch collection")
+        return {"batch_id": batch_id, "status": "skipped", "reclassified": 0}
+
+    response = await request_with_retry(
+        "GET", f"{OPENAI_API_URL}/batches/{batch_id}", headers=llm_headers()
+    )
+    batch = response.json()
+    pool = await get_pool()
+    if batch["status"] != "completed" or not batch.get("output_file_id"):
+        # A job that ended without output gives its comments back to the fallback
+        if batch["status"] in _BATCH_FINAL_STATUSES:
+            await _release_batch_rows(pool, batch_id)
+        return {"batch_id": batch_id, "status": batch["status"], "reclassified": 0}
+
+    output = await request_with_retry(
+        "GET",
+        f"{OPENAI_API_URL}/files/{batch['output_file_id']}/content",
+        headers=llm_headers(),
+    )
+
+    score_ids, labels, confidences = [], [], []
+    usage = Counter()
+    for line in output.content.splitlines():
+        if not line.strip():
+            continue
+        entry = orjson.loads(line)
+        result = entry.get("response") or {}
+        if result.get("status_code") != 200:
+            logger.error(f"LLM batch error for {entry.get('custom_id')}: {entry.get('error')}")
+            continue
+        try:
+            _add_usage(usage, result["body"])
+            [(label, confidence)] = _parse_sentiment_results(result["body"], 1)
+        except Exception as e:
+            logger.error(f"LLM batch parse error for {entry.get('custom_id')}: {e}")
+            continue
+        if label and confidence >= 0.7:
+            score_ids.append(UUID(entry["custom_id"]))
+            labels.append(label)
+            confidences.append(confidence)
+
+    await _apply_llm_labels(pool, score_ids, labels, confidences)
+    await _release_batch_rows(pool, batch_id)
+
+    logger.info(
+        f"LLM batch {batch_id} reclassified {len(score_ids)} comments; "
+        f"{_usage_summary(usage, discount=0.5)}"
+    )
+    return {"batch_id": batch_id, "status": "completed", "reclassified": len(score_ids)}
+
+
 async def analyze_contextual_sentiment(post_id: str) -> dict:
     """Analyze sentiment for all comments on a specific post with context."""
     pool = await get_pool()
@@ -184,11 +526,12 @@ async def analyze_contextual_sentiment(post_id: str) -> dict:
     candidate_name = cand_row["display_name"] if cand_row else "Candidato"
 
     total = len(comments)
-    classified = sum(1 for c in comments if c["final_label"] is not None)
+    labels = Counter(c["final_label"] for c in comments)
+    classified = total - labels[None]
     # Map: positive -> apoio, negative -> contra, neutral -> neutro
-    apoio = sum(1 for c in comments if c["final_label"] == "positive")
-    contra = sum(1 for c in comments if c["final_label"] == "negative")
-    neutro = sum(1 for c in comments if c["final_label"] == "neutral")
+    apoio = labels["positive"]
+    contra = labels["negative"]
+    neutro = labels["neutral"]
 
     caption_text = post["caption"] or ""
     caption_preview = caption_text[:120] if len(caption_text) > 120 else caption_text
@@ -208,39 +551,92 @@ async def analyze_contextual_sentiment(post_id: str) -> dict:
     }
 
 
-async def _call_llm_sentiment(text: str) -> tuple[str | None, float]:
-    """Call LLM API to classify sentiment. Returns (label, confidence)."""
+def _is_worth_llm(text: str) -> bool:
+    """Whether a comment has enough words for the LLM to do better than VADER."""
+    words = _NOISE_RE.sub(" ", text).split()
+    return sum(1 for w in words if w.isalpha() and len(w) > 2) >= 4
+
+
+def _text_hash(text: str) -> bytes:
+    """Cache key for LLM classifications: sha256 of the trimmed, lowercased text."""
+    return hashlib.sha256(text.strip().lower().encode()).digest()
+
+
+def _sentiment_request_body(texts: list[str]) -> dict:
+    """Chat completions request classifying the given comments in one prompt."""
+    numbered = "\n".join(
+        f"{i}. {' '.join(text.split())}" for i, text in enumerate(texts)
+    )
     prompt = (
-        "Classify the sentiment of this Instagram comment as exactly one of: "
-        "positive, negative, neutral.\n"
-        "Respond ONLY with a JSON object: {\"label\": \"...\", \"confidence\": 0.0-1.0}\n\n"
-        f"Comment: {text}"
+        "Classify the sentiment of each numbered Instagram comment below as exactly "
+        "one of: positive, negative, neutral, with a confidence from 0.0 to 1.0. "
+        "Return one result per comment, referencing it by its number.\n\n"
+        f"Comments:\n{numbered}"
     )
+    return {
+        "model": settings.LLM_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.1,
+        "max_tokens": 40 * len(texts),
+        "response_format": {"type": "json_schema", "json_schema": SENTIMENT_SCHEMA},
+    }
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {settings.LLM_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": settings.LLM_MODEL,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.1,
-                "max_tokens": 50,
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
-        content = data["choices"][0]["message"]["content"].strip()
 
-        # Parse JSON response
-        result = json.loads(content)
-        label = result.get("label", "").lower()
-        confidence = float(result.get("confidence", 0.0))
+def _parse_sentiment_results(
+    completion: dict, count: int
+) -> list[tuple[str | None, float]]:
+    """Map a chat completion's indexed results back to (label, confidence) pairs."""
+    content = completion["choices"][0]["message"]["content"]
+    results: list[tuple[str | None, float]] = [(None, 0.0)] * count
+    # The schema guarantees shape and labels; strict mode cannot bound numbers,
+    # so out-of-range indexes and confidences are dropped here
+    for item in orjson.loads(content)["results"]:
+        if 0 <= item["index"] < count and 0.0 <= item["confidence"] <= 1.0:
+            results[item["index"]] = (item["label"], item["confidence"])
+
+    return results
+
+
+async def _call_llm_sentiment_batch(
+    texts: list[str], usage: Counter
+) -> list[tuple[str | None, float]]:
+    """Classify several comments in one LLM call. Returns (label, confidence) per text.
+
+    Token counts reported by the API are added to ``usage``.
+    """
+    response = await request_with_retry(
+        "POST",
+        f"{OPENAI_API_URL}/chat/completions",
+        headers=llm_headers(),
+        json=_sentiment_request_body(texts),
+    )
+    completion = response.json()
+    _add_usage(usage, completion)
+    return _parse_sentiment_results(completion, len(texts))
+
 
-        if label in ("positive", "negative", "neutral"):
-            return label, confidence
+def _add_usage(usage: Counter, completion: dict) -> None:
+    """Accumulate one completion's token usage."""
+    reported = completion.get("usage") or {}
+    usage["calls"] += 1
+    usage["prompt_tokens"] += reported.get("prompt_tokens", 0)
+    usage["completion_tokens"] += reported.get("completion_tokens", 0)
 
-    return None, 0.0
+
+def _usage_summary(usage: Counter, discount: float = 1.0) -> str:
+    """Describe token usage and, for known models, its estimated cost."""
+    calls = usage["calls"]
+    summary = (
+        f"{calls} LLM calls, {usage['prompt_tokens']} prompt + "
+        f"{usage['completion_tokens']} completion tokens"
+    )
+    if calls:
+        tokens_per_call = (usage["prompt_tokens"] + usage["completion_tokens"]) / calls
+        summary += f" ({tokens_per_call:.0f} per call)"
+    prices = LLM_PRICES_PER_1K_TOKENS.get(settings.LLM_MODEL)
+    if prices:
+        cost = (
+            usage["prompt_tokens"] * prices[0] + usage["completion_tokens"] * prices[1]
+        ) / 1000 * discount
+        summary += f", ~${cost:.4f}"
+    return summary
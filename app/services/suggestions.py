@@ -1,13 +1,122 @@
 """Strategic suggestions generation using LLM."""
 
-import json
+import hashlib
+import time
 from datetime import datetime, timezone
 
-import httpx
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from app.core.config import settings
 from app.core.logging import logger
 from app.db.pool import get_pool
+from app.models.schemas import SuggestionItem
+from app.services.llm import OPENAI_API_URL, llm_headers, request_with_retry
+
+_SUGGESTIONS_ADAPTER = TypeAdapter(list[SuggestionItem])
+
+# Snapshot fingerprint -> (expires_at, response); failures are never cached
+_suggestions_cache: dict[str, tuple[float, dict]] = {}
+
+# Static system prompt: keep per-request data out of it so OpenAI prompt
+# caching can reuse the prefix across calls
+SUGGESTIONS_SYSTEM_PROMPT = """Voce e Marcelo Vitorino, um dos maiores especialistas em comunicacao politica do Brasil.
+Analise os dados de campanhas no Instagram enviados pelo usuario e gere sugestoes estrategicas.
+
+Responda APENAS com JSON valido no formato:
+{
+  "resumo_executivo": "breve resumo da situacao geral",
+  "suggestions": [
+    {
+      "title": "titulo da sugestao",
+      "description": "descricao detalhada",
+      "supporting_data": "dados que sustentam a sugestao",
+      "priority": "high|medium|low",
+      "categoria": "engajamento|conteudo|crise|oportunidade",
+      "acoes_concretas": ["acao 1", "acao 2"],
+      "exemplo_post": "exemplo de post sugerido",
+      "roteiro_video": "roteiro de video sugerido se aplicavel ou null",
+      "publico_alvo": "publico-alvo da sugestao",
+      "para_quem": "candidato(a) especifico(a)",
+      "impacto_esperado": "qual impacto esperado"
+    }
+  ]
+}
+
+Gere entre 3 e 6 sugestoes priorizadas. Foque em acoes concretas e praticas."""
+
+
+def _snapshot_fingerprint(data_snapshot: dict) -> str:
+    """Hash the snapshot with sentiment rounded so near-identical data collides."""
+    rounded = {
+        "candidates": [
+            {**c, "avg_sentiment": round(c["avg_sentiment"], 2)}
+            for c in data_snapshot["candidates"]
+        ],
+        "negative_samples": [
+            {**nc, "sentiment": round(nc["sentiment"], 2)}
+            for nc in data_snapshot["negative_samples"]
+        ],
+    }
+    encoded = orjson.dumps(rounded, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _store_suggestions(fingerprint: str, response: dict) -> None:
+    """Cache a successful response, dropping expired entries."""
+    now = time.monotonic()
+    expired = [k for k, (expires_at, _) in _suggestions_cache.items() if expires_at <= now]
+    for key in expired:
+        del _suggestions_cache[key]
+    _suggestions_cache[fingerprint] = (
+        now + settings.SUGGESTIONS_CACHE_TTL_SECONDS, response
+    )
+
+
+def _validate_suggestions(items) -> list[SuggestionItem]:
+    """Validate the LLM's suggestions, logging and dropping the ones that fail."""
+    if not isinstance(items, list):
+        logger.warning(f"LLM suggestions are not a list: {type(items).__name__}")
+        return []
+    try:
+        return _SUGGESTIONS_ADAPTER.validate_python(items)
+    except ValidationError as e:
+        failed = sorted({error["loc"][0] for error in e.errors() if error["loc"]})
+        logger.warning(f"Dropping invalid LLM suggestions at indexes {failed}: {e}")
+        return [
+            SuggestionItem.model_validate(item)
+            for index, item in enumerate(items)
+            if index not in failed
+        ]
+
+
+async def _insert_insights(
+    conn, run_id, insights: list[tuple], snapshot_json: str
+) -> None:
+    """Insert suggestions in one statement, falling back to one row at a time."""
+    if not insights:
+        return
+    sql = """INSERT INTO strategic_insights
+             (scraping_run_id, candidate_id, title, description,
+              supporting_data, priority, llm_model, input_summary)
+             SELECT $1::uuid, t.candidate_id, t.title, t.description,
+                    t.supporting_data, t.priority, $7, $8::jsonb
+             FROM unnest($2::uuid[], $3::text[], $4::text[], $5::text[], $6::text[])
+                  AS t(candidate_id, title, description, supporting_data, priority)"""
+    try:
+        await conn.execute(
+            sql, run_id, *zip(*insights), settings.LLM_MODEL, snapshot_json
+        )
+    except Exception as e:
+        logger.warning(f"Batched insight insert failed, retrying per row: {e}")
+        for insight in insights:
+            try:
+                await conn.execute(
+                    sql, run_id, *([value] for value in insight),
+                    settings.LLM_MODEL, snapshot_json,
+                )
+            except Exception as row_error:
+                logger.warning(f"Insight insert error: {row_error}")
 
 
 async def generate_suggestions() -> dict:
@@ -33,21 +142,29 @@ async def generate_suggestions() -> dict:
                GROUP BY c.id, c.username, c.display_name"""
         )
 
-        # Top themes per candidate
-        themes_data = {}
-        for cand in candidates:
-            themes = await conn.fetch(
-                """SELECT t.theme, COUNT(*) as cnt
-                   FROM themes t
-                   JOIN comments cm ON cm.id = t.comment_id
-                   JOIN posts p ON p.id = cm.post_id
-                   WHERE p.candidate_id = $1
-                   GROUP BY t.theme ORDER BY cnt DESC LIMIT 5""",
-                cand["id"],
+        # Top 5 themes per candidate, in one query
+        theme_rows = await conn.fetch(
+            """SELECT candidate_id, theme, cnt FROM (
+                 SELECT p.candidate_id, t.theme, COUNT(*) as cnt,
+                        ROW_NUMBER() OVER (
+                          PARTITION BY p.candidate_id ORDER BY COUNT(*) DESC
+                        ) as rank
+                 FROM themes t
+                 JOIN comments cm ON cm.id = t.comment_id
+                 JOIN posts p ON p.id = cm.post_id
+                 WHERE p.candidate_id = ANY($1::uuid[])
+                 GROUP BY p.candidate_id, t.theme
+               ) ranked
+               WHERE rank <= 5
+               ORDER BY candidate_id, cnt DESC""",
+            [cand["id"] for cand in candidates],
+        )
+        usernames = {cand["id"]: cand["username"] for cand in candidates}
+        themes_data: dict[str, list[dict]] = {}
+        for t in theme_rows:
+            themes_data.setdefault(usernames[t["candidate_id"]], []).append(
+                {"theme": t["theme"], "count": t["cnt"]}
             )
-            themes_data[cand["username"]] = [
-                {"theme": t["theme"], "count": t["cnt"]} for t in themes
-            ]
 
         # Top negative comments
         neg_comments = await conn.fetch(
@@ -97,94 +214,65 @@ async def generate_suggestions() -> dict:
             "data_snapshot": data_snapshot,
         }
 
-    # Build prompt
-    prompt = f"""Voce e Marcelo Vitorino, um dos maiores especialistas em comunicacao politica do Brasil.
-Analise os dados abaixo de campanhas no Instagram e gere sugestoes estrategicas.
+    # Unchanged analytics give the same suggestions; skip the LLM call
+    fingerprint = _snapshot_fingerprint(data_snapshot)
+    cached = _suggestions_cache.get(fingerprint)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
 
-DADOS:
-{json.dumps(data_snapshot, ensure_ascii=False, indent=2)}
-
-Responda APENAS com JSON valido no formato:
-{{
-  "resumo_executivo": "breve resumo da situacao geral",
-  "suggestions": [
-    {{
-      "title": "titulo da sugestao",
-      "description": "descricao detalhada",
-      "supporting_data": "dados que sustentam a sugestao",
-      "priority": "high|medium|low",
-      "categoria": "engajamento|conteudo|crise|oportunidade",
-      "acoes_concretas": ["acao 1", "acao 2"],
-      "exemplo_post": "exemplo de post sugerido",
-      "roteiro_video": "roteiro de video sugerido se aplicavel ou null",
-      "publico_alvo": "publico-alvo da sugestao",
-      "para_quem": "candidato(a) especifico(a)",
-      "impacto_esperado": "qual impacto esperado"
-    }}
-  ]
-}}
-
-Gere entre 3 e 6 sugestoes priorizadas. Foque em acoes concretas e praticas."""
+    # Only the data varies per request; it goes last so the static prefix is cacheable
+    snapshot_json = orjson.dumps(data_snapshot, option=orjson.OPT_INDENT_2).decode()
+    user_message = f"DADOS:\n{snapshot_json}"
 
     try:
-        async with httpx.AsyncClient(timeout=90.0) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.LLM_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": settings.LLM_MODEL,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.7,
-                    "max_tokens": 3000,
-                },
+        response = await request_with_retry(
+            "POST",
+            f"{OPENAI_API_URL}/chat/completions",
+            headers=llm_headers(),
+            json={
+                "model": settings.LLM_MODEL,
+                "messages": [
+                    {"role": "system", "content": SUGGESTIONS_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message},
+                ],
+                "temperature": 0.7,
+                "max_tokens": 3000,
+                "response_format": {"type": "json_object"},
+            },
+        )
+        data = response.json()
+        result = orjson.loads(data["choices"][0]["message"]["content"])
+        suggestions = _validate_suggestions(result.get("suggestions", []))
+
+        # Save insights to DB
+        async with pool.acquire() as conn:
+            last_run = await conn.fetchrow(
+                "SELECT id FROM scraping_runs ORDER BY started_at DESC LIMIT 1"
             )
-            response.raise_for_status()
-            data = response.json()
-            content = data["choices"][0]["message"]["content"].strip()
-
-            # Clean markdown code blocks if present
-            if content.startswith("```"):
-                content = content.split("\n", 1)[1]
-            if content.endswith("```"):
-                content = content.rsplit("```", 1)[0]
-            content = content.strip()
-
-            result = json.loads(content)
-
-            # Save insights to DB
-            async with pool.acquire() as conn:
-                last_run = await conn.fetchrow(
-                    "SELECT id FROM scraping_runs ORDER BY started_at DESC LIMIT 1"
-                )
-                run_id = last_run["id"] if last_run else None
-
-                for suggestion in result.get("suggestions", []):
-                    for cand in candidates:
-                        if cand["username"] in suggestion.get("para_quem", ""):
-                            await conn.execute(
-                                """INSERT INTO strategic_insights
-                                   (scraping_run_id, candidate_id, title, description,
-                                    supporting_data, priority, llm_model, input_summary)
-                                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb)""",
-                                run_id, cand["id"],
-                                suggestion["title"],
-                                suggestion["description"],
-                                suggestion.get("supporting_data"),
-                                suggestion.get("priority", "medium"),
-                                settings.LLM_MODEL,
-                                json.dumps(data_snapshot),
-                            )
-                            break
-
-            return {
-                "suggestions": result.get("suggestions", []),
-                "resumo_executivo": result.get("resumo_executivo", ""),
-                "generated_at": datetime.now(timezone.utc).isoformat(),
-                "data_snapshot": data_snapshot,
-            }
+            run_id = last_run["id"] if last_run else None
+
+            insights = []
+            for suggestion in suggestions:
+                for cand in candidates:
+                    if cand["username"] in (suggestion.para_quem or ""):
+                        insights.append((
+                            cand["id"],
+                            suggestion.title,
+                            suggestion.description,
+                            suggestion.supporting_data,
+                            suggestion.priority,
+                        ))
+                        break
+            await _insert_insights(conn, run_id, insights, snapshot_json)
+
+        generated = {
+            "suggestions": [s.model_dump() for s in suggestions],
+            "resumo_executivo": result.get("resumo_executivo", ""),
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "data_snapshot": data_snapshot,
+        }
+        _store_suggestions(fingerprint, generated)
+        return generated
 
     except Exception as e:
         logger.error(f"Suggestions generation failed: {e}")
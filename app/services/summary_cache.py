@@ -0,0 +1,83 @@
+"""In-process TTL cache for analytics responses."""
+
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+
+from app.core.config import settings
+
+MAX_ENTRIES = 128
+
+# XFetch tuning: values above 1.0 favour earlier refreshes
+EARLY_REFRESH_BETA = 1.0
+
+# key -> (expires_at, compute_seconds, value), least recently used first
+_cache: OrderedDict[Hashable, tuple[float, float, dict]] = OrderedDict()
+# key -> single-flight lock guarding recomputation
+_locks: dict[Hashable, asyncio.Lock] = {}
+
+
+def _should_refresh(entry: tuple[float, float, dict]) -> bool:
+    """XFetch: refresh early with a probability that grows as expiry nears."""
+    expires_at, delta, _ = entry
+    jitter = -delta * EARLY_REFRESH_BETA * math.log(1.0 - random.random())
+    return time.monotonic() + jitter >= expires_at
+
+
+async def cached_summary(
+    key: Hashable,
+    compute: Callable[[], Awaitable[dict]],
+    ttl: float | None = None,
+) -> dict:
+    """Return the cached response for key, computing and storing it on a miss.
+
+    Only one request per key recomputes at a time; while it does, the other
+    requests are served the stale value if there is one.
+    """
+    entry = _cache.get(key)
+    if entry and not _should_refresh(entry):
+        _cache.move_to_end(key)
+        return entry[2]
+
+    lock = _locks.get(key)
+    if lock is None:
+        lock = _locks[key] = asyncio.Lock()
+    elif entry and lock.locked():
+        return entry[2]
+
+    try:
+        async with lock:
+            # Another request may have refreshed the entry while we waited
+            current = _cache.get(key)
+            if current is not None and current is not entry and current[0] > time.monotonic():
+                return current[2]
+
+            started = time.monotonic()
+            value = await compute()
+            finished = time.monotonic()
+
+            ttl = settings.ANALYTICS_CACHE_TTL_SECONDS if ttl is None else ttl
+            _cache[key] = (finished + ttl, finished - started, value)
+            _cache.move_to_end(key)
+            while len(_cache) > MAX_ENTRIES:
+                evicted, _ = _cache.popitem(last=False)
+                evicted_lock = _locks.get(evicted)
+                if evicted_lock and not evicted_lock.locked():
+                    del _locks[evicted]
+    finally:
+        # A failed compute stores nothing; drop its lock so keys built from
+        # arbitrary query params cannot accumulate
+        if key not in _cache and _locks.get(key) is lock and not lock.locked():
+            del _locks[key]
+
+    return value
+
+
+def invalidate_summary_cache() -> None:
+    """Drop every cached response so fresh pipeline data is served immediately."""
+    _cache.clear()
+    for key in [k for k, lock in _locks.items() if not lock.locked()]:
+        del _locks[key]
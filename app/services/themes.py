@@ -1,72 +1,137 @@
 """Theme classification using keyword matching."""
 
+import asyncio
+import functools
 import re
 import unicodedata
+from collections import Counter
+from contextlib import aclosing
 
 from app.core.constants import BIGRAM_TERMS, STOP_WORDS_PT, THEME_KEYWORDS
 from app.core.logging import logger
 from app.db.pool import get_pool
+from app.db.work_queue import iter_work_queue
 
 
+# (comment, theme) pairs per batched INSERT statement
+THEME_INSERT_BATCH_SIZE = 500
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+# Portuguese accented letters, stripped in one C-level pass
+_ACCENT_TABLE = str.maketrans(
+    "áàâãäéèêëíìîïóòôõöúùûüçÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇ",
+    "aaaaaeeeeiiiiooooouuuucAAAAAEEEEIIIIOOOOOUUUUC",
+)
+
+
+@functools.lru_cache(maxsize=8192)
 def _normalize(text: str) -> str:
     """Remove accents and lowercase."""
+    translated = text.translate(_ACCENT_TABLE)
+    if translated.isascii():
+        return translated.lower()
+    # Other scripts, emoji and compatibility characters take the full NFKD path
     nfkd = unicodedata.normalize("NFKD", text)
     return "".join(c for c in nfkd if not unicodedata.combining(c)).lower()
 
 
+def _build_keyword_index() -> tuple[
+    list[tuple[str, tuple[str, ...]]], dict[str, tuple[str, ...]]
+]:
+    """Map bigrams and single words to their themes, in THEME_KEYWORDS order."""
+    bigram_themes = [
+        (bigram, tuple(t for t, kws in THEME_KEYWORDS.items() if bigram in kws))
+        for bigram in BIGRAM_TERMS
+    ]
+    word_themes: dict[str, tuple[str, ...]] = {}
+    for theme, keywords in THEME_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in STOP_WORDS_PT or len(keyword) < 3:
+                continue
+            if theme not in word_themes.get(keyword, ()):
+                word_themes[keyword] = word_themes.get(keyword, ()) + (theme,)
+    return [(b, themes) for b, themes in bigram_themes if themes], word_themes
+
+
+_BIGRAM_THEMES, _WORD_THEMES = _build_keyword_index()
+_BIGRAM_WORDS = {bigram: tuple(bigram.split()) for bigram in BIGRAM_TERMS}
+# Texts shorter than the shortest keyword cannot match any theme
+_MIN_KEYWORD_LEN = min(len(k) for k in [*_WORD_THEMES, *(b for b, _ in _BIGRAM_THEMES)])
+
+
 def classify_themes(text: str) -> list[str]:
     """Classify text into theme categories using keyword matching."""
     normalized = _normalize(text)
+    if len(normalized) < _MIN_KEYWORD_LEN:
+        return ["outros"]
     found: list[str] = []
 
     # Check bigrams first
-    for bigram in BIGRAM_TERMS:
+    for bigram, themes in _BIGRAM_THEMES:
         if bigram in normalized:
-            for theme, keywords in THEME_KEYWORDS.items():
-                if bigram in keywords:
-                    if theme not in found:
-                        found.append(theme)
+            for theme in themes:
+                if theme not in found:
+                    found.append(theme)
 
     # Check unigrams
-    words = re.findall(r"\b\w+\b", normalized)
-    for word in words:
-        if word in STOP_WORDS_PT or len(word) < 3:
-            continue
-        for theme, keywords in THEME_KEYWORDS.items():
-            if word in keywords and theme not in found:
+    for word in _WORD_RE.findall(normalized):
+        for theme in _WORD_THEMES.get(word, ()):
+            if theme not in found:
                 found.append(theme)
 
     return found if found else ["outros"]
 
 
-async def classify_unclassified_comments() -> int:
-    """Classify themes for comments that don't have theme entries yet."""
-    pool = await get_pool()
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            """SELECT c.id, c.text FROM comments c
-               LEFT JOIN themes t ON t.comment_id = c.id
-               WHERE t.id IS NULL AND c.text IS NOT NULL AND c.text != ''"""
-        )
+def _classify_rows(rows: list) -> list[tuple]:
+    """Classify a page of comments into (comment_id, theme) pairs."""
+    return [
+        (row["id"], theme) for row in rows for theme in classify_themes(row["text"])
+    ]
+
+
+async def classify_unclassified_comments(rows: list | None = None) -> int:
+    """Classify themes for comments that don't have theme entries yet.
+
+    The pipeline passes one page of ``comments_work_queue``; otherwise the
+    queue is read page by page.
+    """
+    if rows is None:
+        count = 0
+        async with aclosing(iter_work_queue("needs_theme")) as pages:
+            async for page in pages:
+                count += await classify_unclassified_comments(page)
+        return count
 
     if not rows:
         return 0
 
+    # Keyword matching is CPU-bound; keep it off the event loop
+    pairs = await asyncio.to_thread(_classify_rows, rows)
+    sql = """INSERT INTO themes (comment_id, theme, confidence, method)
+             SELECT t.comment_id, t.theme::theme_category, 1.0,
+                    'keyword'::analysis_method
+             FROM unnest($1::uuid[], $2::text[]) AS t(comment_id, theme)
+             ON CONFLICT (comment_id, theme, method) DO NOTHING"""
+
     count = 0
+    pool = await get_pool()
     async with pool.acquire() as conn:
-        for row in rows:
-            themes = classify_themes(row["text"])
-            for theme in themes:
-                try:
-                    await conn.execute(
-                        """INSERT INTO themes (comment_id, theme, confidence, method)
-                           VALUES ($1, $2::theme_category, 1.0, 'keyword'::analysis_method)
-                           ON CONFLICT (comment_id, theme, method) DO NOTHING""",
-                        row["id"], theme,
-                    )
-                    count += 1
-                except Exception as e:
-                    logger.debug(f"Theme insert error: {e}")
+        for start in range(0, len(pairs), THEME_INSERT_BATCH_SIZE):
+            batch = pairs[start:start + THEME_INSERT_BATCH_SIZE]
+            try:
+                await conn.execute(sql, *zip(*batch))
+                count += len(batch)
+            except Exception as e:
+                # Retry row by row so one bad pair doesn't drop the whole batch
+                logger.warning(f"Batched theme insert failed, retrying per row: {e}")
+                for pair in batch:
+                    try:
+                        await conn.execute(sql, *([value] for value in pair))
+                        count += 1
+                    except Exception as row_error:
+                        logger.debug(f"Theme insert error: {row_error}")
 
     logger.info(f"Classified themes for {count} comment-theme pairs")
     return count
@@ -76,30 +141,21 @@ def extract_words_for_wordcloud(
     texts: list[str], max_words: int = 200
 ) -> list[dict]:
     """Extract word frequencies for wordcloud, filtering stop words."""
-    word_freq: dict[str, int] = {}
+    word_freq: Counter[str] = Counter()
 
     for text in texts:
         normalized = _normalize(text)
 
         # Check bigrams
-        for bigram in BIGRAM_TERMS:
-            occurrences = normalized.count(bigram)
-            if occurrences > 0:
-                word_freq[bigram] = word_freq.get(bigram, 0) + occurrences
-
-        # Unigrams
-        words = re.findall(r"\b\w+\b", normalized)
-        for word in words:
-            if word in STOP_WORDS_PT or len(word) < 3:
-                continue
-            # Skip if part of a counted bigram
-            skip = False
-            for bigram in BIGRAM_TERMS:
-                if word in bigram.split() and bigram in normalized:
-                    skip = True
-                    break
-            if not skip:
-                word_freq[word] = word_freq.get(word, 0) + 1
-
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [{"word": w, "count": c} for w, c in sorted_words[:max_words]]
+        present = [bigram for bigram in BIGRAM_TERMS if bigram in normalized]
+        for bigram in present:
+            word_freq[bigram] += normalized.count(bigram)
+
+        # Unigrams, skipping words that are part of a counted bigram
+        in_bigrams = {word for bigram in present for word in _BIGRAM_WORDS[bigram]}
+        word_freq.update(
+            word for word in _WORD_RE.findall(normalized)
+            if len(word) >= 3 and word not in STOP_WORDS_PT and word not in in_bigrams
+        )
+
+    return [{"word": w, "count": c} for w, c in word_freq.most_common(max_words)]
@@ -0,0 +1,12 @@
+CREATE OR REPLACE VIEW comments_work_queue AS
+SELECT
+    c.id,
+    c.text,
+    NOT EXISTS (
+        SELECT 1 FROM sentiment_scores s WHERE s.comment_id = c.id
+    ) AS needs_vader,
+    NOT EXISTS (
+        SELECT 1 FROM themes t WHERE t.comment_id = c.id
+    ) AS needs_theme
+FROM comments c
+WHERE c.text IS NOT NULL AND c.text != '';
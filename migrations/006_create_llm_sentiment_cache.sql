@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS llm_sentiment_cache (
+    text_hash BYTEA NOT NULL,
+    model TEXT NOT NULL,
+    label sentiment_label NOT NULL,
+    confidence DOUBLE PRECISION NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (text_hash, model)
+);
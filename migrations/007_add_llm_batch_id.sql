@@ -0,0 +1,5 @@
+-- Comments submitted to an OpenAI Batch API job awaiting collection
+ALTER TABLE sentiment_scores ADD COLUMN IF NOT EXISTS llm_batch_id TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_sentiment_llm_batch ON sentiment_scores(llm_batch_id)
+    WHERE llm_batch_id IS NOT NULL;
@@ -0,0 +1,117 @@
+"""Tests for the health, liveness and readiness endpoints."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.main import app
+from app.routers import health
+
+
+class FakeConnection:
+    async def fetchval(self, query):
+        return 1
+
+
+class FakePool:
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection()
+
+
+def _get(path: str) -> httpx.Response:
+    async def request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path)
+
+    return asyncio.run(request())
+
+
+def _scrape_info(age_seconds: float) -> dict:
+    finished = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    return {"status": "success", "last_success_at": finished.isoformat()}
+
+
+@pytest.fixture(autouse=True)
+def reset_probe_cache():
+    health._probe_cache = None
+    yield
+    health._probe_cache = None
+
+
+class TestLivenessReadiness:
+    def test_livez_makes_no_database_calls(self):
+        with patch.object(health, "get_pool", AsyncMock()) as get_pool:
+            response = _get("/livez")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        assert get_pool.call_count == 0
+
+    def test_readyz_reports_connected_database(self):
+        with (
+            patch.object(health, "get_pool", AsyncMock(return_value=FakePool())),
+            patch.object(health, "get_last_scrape_info", AsyncMock(return_value=_scrape_info(60))),
+        ):
+            response = _get("/readyz")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["database"] == "connected"
+        assert body["stale"] is False
+
+    def test_readyz_returns_503_when_database_is_down(self):
+        with patch.object(health, "get_pool", AsyncMock(side_effect=OSError("down"))):
+            response = _get("/readyz")
+
+        assert response.status_code == 503
+        assert response.json()["database"] == "disconnected"
+
+    def test_health_stays_200_when_database_is_down(self):
+        with patch.object(health, "get_pool", AsyncMock(side_effect=OSError("down"))):
+            response = _get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "degraded"
+
+    def test_successful_probe_is_cached(self):
+        get_pool = AsyncMock(return_value=FakePool())
+        with (
+            patch.object(health, "get_pool", get_pool),
+            patch.object(health, "get_last_scrape_info", AsyncMock(return_value=_scrape_info(60))),
+        ):
+            _get("/readyz")
+            _get("/readyz")
+
+        assert get_pool.call_count == 1
+
+    def test_failed_scrape_read_is_not_cached(self):
+        get_pool = AsyncMock(return_value=FakePool())
+        with (
+            patch.object(health, "get_pool", get_pool),
+            patch.object(health, "get_last_scrape_info", AsyncMock(side_effect=OSError("down"))),
+        ):
+            _get("/readyz")
+            _get("/readyz")
+
+        assert get_pool.call_count == 2
+
+
+class TestStaleness:
+    def test_recent_success_is_fresh(self):
+        assert not health._is_stale(_scrape_info(settings.HEALTH_SCRAPE_MAX_AGE_SEC - 60))
+
+    def test_old_success_is_stale(self):
+        assert health._is_stale(_scrape_info(settings.HEALTH_SCRAPE_MAX_AGE_SEC + 60))
+
+    def test_no_successful_run_is_stale(self):
+        assert health._is_stale({"status": "failed", "last_success_at": None})
+
+    def test_no_runs_is_stale(self):
+        assert health._is_stale(None)
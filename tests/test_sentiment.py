@@ -0,0 +1,60 @@
+"""Tests for sentiment helpers and LLM result parsing."""
+
+import orjson
+import pytest
+
+from app.services.sentiment import (
+    _is_worth_llm,
+    _parse_sentiment_results,
+    _text_hash,
+    classify_vader,
+)
+
+
+def _completion(results: list[dict]) -> dict:
+    content = orjson.dumps({"results": results}).decode()
+    return {"choices": [{"message": {"content": content}}]}
+
+
+class TestClassifyVader:
+    @pytest.mark.parametrize(
+        ("compound", "label"),
+        [(0.05, "positive"), (0.5, "positive"), (-0.05, "negative"), (0.0, "neutral"), (0.049, "neutral")],
+    )
+    def test_thresholds(self, compound, label):
+        assert classify_vader(compound) == label
+
+
+class TestIsWorthLlm:
+    def test_sentence_with_enough_words(self):
+        assert _is_worth_llm("Esse candidato nao cumpriu nenhuma promessa feita")
+
+    def test_emoji_mentions_and_links_are_not_enough(self):
+        assert not _is_worth_llm("@fulano 👏👏👏 https://example.com #vote top")
+
+
+class TestTextHash:
+    def test_ignores_case_and_surrounding_whitespace(self):
+        assert _text_hash("  Muito Bom ") == _text_hash("muito bom")
+
+
+class TestParseSentimentResults:
+    def test_maps_results_by_index(self):
+        completion = _completion([
+            {"index": 1, "label": "negative", "confidence": 0.9},
+            {"index": 0, "label": "positive", "confidence": 0.8},
+        ])
+        assert _parse_sentiment_results(completion, 2) == [("positive", 0.8), ("negative", 0.9)]
+
+    def test_missing_results_are_empty(self):
+        completion = _completion([{"index": 0, "label": "neutral", "confidence": 0.75}])
+        assert _parse_sentiment_results(completion, 2) == [("neutral", 0.75), (None, 0.0)]
+
+    def test_out_of_range_index_is_ignored(self):
+        completion = _completion([{"index": 5, "label": "positive", "confidence": 0.9}])
+        assert _parse_sentiment_results(completion, 1) == [(None, 0.0)]
+
+    @pytest.mark.parametrize("confidence", [1.3, -0.2])
+    def test_out_of_range_confidence_is_ignored(self, confidence):
+        completion = _completion([{"index": 0, "label": "positive", "confidence": confidence}])
+        assert _parse_sentiment_results(completion, 1) == [(None, 0.0)]
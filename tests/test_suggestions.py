@@ -0,0 +1,42 @@
+"""Tests for strategic suggestion helpers."""
+
+from app.services.suggestions import _snapshot_fingerprint, _validate_suggestions
+
+
+def _snapshot(avg_sentiment: float, sentiment: float = -0.6) -> dict:
+    return {
+        "candidates": [{"username": "fulano", "total_comments": 10, "avg_sentiment": avg_sentiment}],
+        "negative_samples": [{"text": "ruim", "sentiment": sentiment}],
+    }
+
+
+class TestSnapshotFingerprint:
+    def test_near_identical_sentiment_collides(self):
+        assert _snapshot_fingerprint(_snapshot(0.1231)) == _snapshot_fingerprint(_snapshot(0.1249))
+
+    def test_changed_sentiment_differs(self):
+        assert _snapshot_fingerprint(_snapshot(0.12)) != _snapshot_fingerprint(_snapshot(0.25))
+
+    def test_key_order_does_not_matter(self):
+        reordered = {
+            "negative_samples": [{"sentiment": -0.6, "text": "ruim"}],
+            "candidates": [{"avg_sentiment": 0.1, "total_comments": 10, "username": "fulano"}],
+        }
+        assert _snapshot_fingerprint(reordered) == _snapshot_fingerprint(_snapshot(0.1))
+
+
+class TestValidateSuggestions:
+    def test_invalid_items_are_dropped(self):
+        suggestions = _validate_suggestions([
+            {"title": "a", "description": "b"},
+            {"description": "missing title"},
+            {"title": "c", "description": "d", "acoes_concretas": "not a list"},
+        ])
+        assert [s.title for s in suggestions] == ["a"]
+
+    def test_priority_is_normalized(self):
+        [suggestion] = _validate_suggestions([{"title": "a", "description": "b", "priority": " HIGH "}])
+        assert suggestion.priority == "high"
+
+    def test_non_list_is_empty(self):
+        assert _validate_suggestions("not a list") == []
@@ -0,0 +1,63 @@
+"""Tests for the in-process analytics response cache."""
+
+import asyncio
+
+import pytest
+
+from app.services import summary_cache
+from app.services.summary_cache import cached_summary, invalidate_summary_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    invalidate_summary_cache()
+    yield
+    invalidate_summary_cache()
+
+
+class TestCachedSummary:
+    def test_concurrent_misses_compute_once(self):
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        async def run():
+            return await asyncio.gather(*(cached_summary("key", compute) for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert calls == 1
+        assert results == [{"value": 1}] * 5
+
+    def test_hit_is_served_from_cache(self):
+        async def compute():
+            return {"value": 1}
+
+        async def run():
+            await cached_summary("key", compute, ttl=60)
+            return await cached_summary("key", lambda: pytest.fail("recomputed"), ttl=60)
+
+        assert asyncio.run(run()) == {"value": 1}
+
+    def test_failed_compute_leaves_no_lock(self):
+        async def compute():
+            raise ValueError("boom")
+
+        async def run():
+            for key in range(3):
+                with pytest.raises(ValueError):
+                    await cached_summary(("bad", key), compute)
+
+        asyncio.run(run())
+        assert summary_cache._locks == {}
+
+    def test_invalidate_drops_entries(self):
+        async def compute():
+            return {"value": 1}
+
+        asyncio.run(cached_summary("key", compute, ttl=60))
+        invalidate_summary_cache()
+        assert summary_cache._cache == {}
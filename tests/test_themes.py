@@ -0,0 +1,52 @@
+"""Tests for keyword theme classification."""
+
+from app.core.constants import THEME_KEYWORDS
+from app.services.themes import (
+    _BIGRAM_THEMES,
+    _WORD_THEMES,
+    _normalize,
+    classify_themes,
+    extract_words_for_wordcloud,
+)
+
+
+class TestNormalize:
+    def test_strips_portuguese_accents_and_lowercases(self):
+        assert _normalize("Saúde, EDUCAÇÃO e Segurança") == "saude, educacao e seguranca"
+
+    def test_other_scripts_take_the_nfkd_path(self):
+        assert _normalize("Ñandú Ｖｏｔｏ") == "nandu voto"
+
+
+class TestKeywordIndex:
+    def test_every_word_keyword_maps_to_its_themes(self):
+        for word, themes in _WORD_THEMES.items():
+            for theme in themes:
+                assert word in THEME_KEYWORDS[theme]
+
+    def test_shared_keyword_keeps_theme_order(self):
+        themes = [t for t, keywords in THEME_KEYWORDS.items() if "emprego" in keywords]
+        assert _WORD_THEMES["emprego"] == tuple(themes)
+
+    def test_bigrams_are_indexed(self):
+        assert ("meio ambiente", ("meio_ambiente",)) in _BIGRAM_THEMES
+
+
+class TestClassifyThemes:
+    def test_matches_accented_words(self):
+        assert classify_themes("A saúde pública e a educação") == ["saude", "educacao"]
+
+    def test_matches_bigrams(self):
+        assert "meio_ambiente" in classify_themes("Cuidar do meio ambiente é urgente")
+
+    def test_short_text_is_outros(self):
+        assert classify_themes("oi") == ["outros"]
+
+    def test_unmatched_text_is_outros(self):
+        assert classify_themes("que lindo dia") == ["outros"]
+
+
+class TestWordcloud:
+    def test_counts_words_across_texts(self):
+        words = extract_words_for_wordcloud(["Saúde saúde hospital", "hospital"], max_words=2)
+        assert {w["word"]: w["count"] for w in words} == {"saude": 2, "hospital": 2}
@@ -0,0 +1,68 @@
+"""Tests for keyset-paginated work queue reads."""
+
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+from unittest.mock import patch
+
+from app.db import work_queue
+
+
+class FakeConnection:
+    def __init__(self, ids: list[int], calls: list):
+        self.ids = ids
+        self.calls = calls
+
+    async def fetch(self, query, after, page_size):
+        self.calls.append(after)
+        await asyncio.sleep(0)
+        remaining = [i for i in self.ids if after is None or i > after]
+        return [{"id": i} for i in remaining[:page_size]]
+
+
+class FakePool:
+    def __init__(self, ids: list[int]):
+        self.ids = ids
+        self.calls: list = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self.ids, self.calls)
+
+
+def _read_pages(pool: FakePool, page_size: int, stop_after: int | None = None) -> list:
+    async def get_pool():
+        return pool
+
+    async def run():
+        pages = []
+        with patch.object(work_queue, "get_pool", get_pool):
+            async with aclosing(work_queue.iter_work_queue(page_size=page_size)) as queue:
+                async for page in queue:
+                    pages.append([row["id"] for row in page])
+                    if stop_after is not None and len(pages) == stop_after:
+                        break
+        await asyncio.sleep(0.01)
+        leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return pages, leftover
+
+    return asyncio.run(run())
+
+
+class TestIterWorkQueue:
+    def test_pages_by_last_id(self):
+        pool = FakePool(list(range(7)))
+        pages, _ = _read_pages(pool, page_size=3)
+        assert pages == [[0, 1, 2], [3, 4, 5], [6]]
+        assert pool.calls == [None, 2, 5]
+
+    def test_full_last_page_ends_on_empty_fetch(self):
+        pool = FakePool(list(range(4)))
+        pages, _ = _read_pages(pool, page_size=2)
+        assert pages == [[0, 1], [2, 3]]
+        assert pool.calls == [None, 1, 3]
+
+    def test_early_exit_cancels_prefetch(self):
+        pool = FakePool(list(range(10)))
+        pages, leftover = _read_pages(pool, page_size=2, stop_after=1)
+        assert pages == [[0, 1]]
+        assert leftover == []